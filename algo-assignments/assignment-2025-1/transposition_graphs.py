@@ -1,28 +1,45 @@
+import io
 import sys
 import argparse
+from array import array
+from itertools import combinations
 
 def generate_graph(s, t):
+    if s < 0 or t < 0:
+        raise ValueError("The numbers of 0s and 1s must be non-negative")
     n = s + t
-    nodes = []
-    for i in range(2**n):
-        binary = bin(i)[2:].zfill(n)
-        if binary.count('0') == s:
-            nodes.append(int(binary, 2))
-    nodes = sorted(nodes, reverse=True)
+    if n == 0:
+        return array('q', [0]), array('I'), [], []
+    if s == 0 or t == 0:
+        # A single node of all 1s or all 0s, with no neighbours
+        node = (1 << t) - 1
+        return array('q', [0, 0]), array('I'), [node], [format(node, f'0{n}b')]
+    # Choosing bit positions from the highest down yields nodes in descending order
+    nodes = [sum(1 << p for p in ones) for ones in combinations(range(n-1, -1, -1), t)]
+    index = {node: i for i, node in enumerate(nodes)}
 
-    adj = {}
+    # CSR adjacency: the neighbours of nodes[i] are the node indices
+    # indices[indptr[i]:indptr[i+1]]
+    indptr = array('q', [0])
+    indices = array('I')
     for node in nodes:
-        binary_str = bin(node)[2:].zfill(n)
-        adj_nodes = []
-        for i in range(n-1):
-            if binary_str[i] != binary_str[i+1]:  # Adjacent bits are different
-                new_bits = list(binary_str)
-                new_bits[i], new_bits[i+1] = new_bits[i+1], new_bits[i]  # Swap
-                new_str = ''.join(new_bits)
-                new_node = int(new_str, 2)
-                adj_nodes.append(new_node)
-        adj[node] = sorted(adj_nodes, reverse=True)
-    return adj, nodes
+        # Swapping bits i+1, i gives node +/- 2^i, so scanning i from the top
+        # yields larger neighbours in descending and smaller ones in ascending order
+        smaller = []
+        for i in range(n-2, -1, -1):
+            if ((node >> i) ^ (node >> (i+1))) & 1:  # Adjacent bits are different
+                if (node >> i) & 1:
+                    indices.append(index[node ^ (3 << i)])  # Swap
+                else:
+                    smaller.append(index[node ^ (3 << i)])
+        smaller.reverse()
+        indices.extend(smaller)
+        indptr.append(len(indices))
+    binaries = [format(node, f'0{n}b') for node in nodes]
+    return indptr, indices, nodes, binaries
+
+def neighbours(indptr, indices, i):
+    return indices[indptr[i]:indptr[i+1]]
 
 def main():
     parser = argparse.ArgumentParser(description='Transposition Graph Generator')
@@ -33,10 +50,16 @@ def main():
     args = parser.parse_args()
 
     if args.method == 'graph':
-        adj, nodes = generate_graph(args.s, args.t)
-        for node in nodes:
-            binary = bin(node)[2:].zfill(args.s + args.t)
-            print(f"{node} ({binary}) -> {adj[node]}")
+        try:
+            indptr, indices, nodes, binaries = generate_graph(args.s, args.t)
+        except ValueError as e:
+            parser.error(str(e))
+        out = io.StringIO()
+        write = out.write
+        for i, (node, binary) in enumerate(zip(nodes, binaries)):
+            adj_nodes = [nodes[j] for j in neighbours(indptr, indices, i)]
+            write(f"{node} ({binary}) -> {adj_nodes}\n")
+        sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     main()
@@ -3,36 +3,60 @@
 Sparse Table Library Sorting Implementation
 
 This module implements a dynamic sparse table data structure that maintains
-sorted keys across different capacity levels with specific distribution patterns.
+sorted keys across different capacity levels.
 
-The sparse table automatically rebuilds itself when capacity thresholds are exceeded,
-distributing keys according to predefined patterns for optimal performance.
+The sparse table automatically rebuilds itself when capacity thresholds are exceeded.
+Whenever the keys are redistributed, every key gets a run of consecutive slots and
+run lengths differ by at most one: growing the table or inserting gives the longer
+runs to the smallest keys, shrinking it gives them to the largest keys.
 """
 
+import io
 import sys
 import argparse
 import json
+from array import array
+from bisect import bisect_left, bisect_right
 
 
-def binary_search_leftmost(array, target):
+def new_storage(keys):
     """
-    Find the leftmost position where target should be inserted to maintain sorted order.
+    Create a storage array holding the given keys.
+    
+    Integer keys are stored unboxed in an array('q'), which takes 8 bytes
+    per slot instead of a pointer to an int object; any other keys (floats,
+    strings, integers beyond 64 bits) fall back to a plain list.
     
     Args:
-        array: Sorted array to search in
-        target: Value to find insertion position for
+        keys: Keys the storage will hold
         
     Returns:
-        Index where target should be inserted
+        array('q') or list with the keys, in order
     """
-    left, right = 0, len(array)
-    while left < right:
-        middle = (left + right) // 2
-        if array[middle] < target:
-            left = middle + 1
-        else:
-            right = middle
-    return left
+    try:
+        return array('q', keys)
+    except (TypeError, OverflowError):
+        return list(keys)
+
+
+def fill_runs(storage, start, keys, run_length):
+    """
+    Write equal-length runs of keys into storage, starting at start.
+    
+    Slot start + i * run_length + j holds keys[i] for every offset j, so
+    the runs are written as run_length strided slice assignments instead
+    of one assignment per slot.
+    
+    Args:
+        storage: Storage array to write into
+        start: First slot of the first run
+        keys: Keys in the order their runs should appear, of the same
+            type as storage
+        run_length: Number of slots for each key
+    """
+    stop = start + len(keys) * run_length
+    for offset in range(run_length):
+        storage[start + offset:stop:run_length] = keys
 
 
 class SparseTable:
@@ -46,12 +70,17 @@ class SparseTable:
     Attributes:
         capacity_limits (list): Maximum number of keys allowed at each level
         capacity_multipliers (list): Size multipliers for each level  
+        level_capacities (list): Physical array size for each level
         current_level (int): Current operating level (1-indexed)
         current_capacity (int): Current physical array size
+        sorted_keys (list): Unique keys currently stored, in ascending order
         unique_key_count (int): Number of unique keys currently stored
         head_position (int): Index of the "authentic" (marked) position
-        storage_array (list): Physical storage for the keys
+        storage_array (array or list): Physical storage for the keys
     """
+    __slots__ = ('capacity_limits', 'capacity_multipliers', 'level_capacities',
+                 'current_level', 'current_capacity', 'sorted_keys',
+                 'unique_key_count', 'head_position', 'storage_array')
     
     def __init__(self, capacity_limits, capacity_multipliers, initial_level, first_key):
         """
@@ -67,14 +96,16 @@ class SparseTable:
         self.capacity_multipliers = capacity_multipliers
         self.current_level = initial_level
         
-        # Calculate physical array size for current level
-        level_index = self.current_level - 1
-        self.current_capacity = int(round(
-            self.capacity_limits[level_index] * self.capacity_multipliers[level_index]
-        ))
+        # Calculate physical array size for every level once
+        self.level_capacities = [
+            int(round(limit * multiplier))
+            for limit, multiplier in zip(capacity_limits, capacity_multipliers)
+        ]
+        self.current_capacity = self.level_capacities[self.current_level - 1]
         
         # Initialize storage with the first key
-        self.storage_array = [first_key] * self.current_capacity
+        self.storage_array = new_storage([first_key]) * self.current_capacity
+        self.sorted_keys = [first_key]
         self.unique_key_count = 1
         self.head_position = 0
 
@@ -96,213 +127,104 @@ class SparseTable:
         """
         return (self.head_position + logical_position) % self.current_capacity
     
-    def _get_logical_view(self):
-        """
-        Get the logical view of the array starting from the head position.
-        
-        Returns:
-            List representing the logical sorted view of all elements
-        """
-        logical_array = []
-        for i in range(self.current_capacity):
-            physical_index = self._get_physical_index(i)
-            logical_array.append(self.storage_array[physical_index])
-        return logical_array
-    
-    def _is_authentic_position(self, logical_position):
-        """
-        Check if a logical position contains an "authentic" occurrence of its value.
-        
-        An authentic position is one where the value differs from the next position
-        in the circular array, making it a candidate for the marked position.
-        
-        Args:
-            logical_position: Position to check in logical view
-            
-        Returns:
-            True if this position contains an authentic occurrence
-        """
-        next_logical = (logical_position + 1) % self.current_capacity
-        logical_view = self._get_logical_view()
-        return logical_view[logical_position] != logical_view[next_logical]
-    
-    def _find_optimal_head_position(self):
-        """
-        Find the optimal head position by locating the smallest authentic value.
-        
-        The head should point to the authentic occurrence of the smallest value
-        that differs from its neighbor in the circular array.
-        """
-        best_position = None
-        
-        for i in range(self.current_capacity):
-            # Check if this position has a different value than the previous position
-            prev_index = (i - 1) % self.current_capacity
-            if self.storage_array[i] != self.storage_array[prev_index]:
-                # This is a potential head position
-                if (best_position is None or 
-                    self.storage_array[i] < self.storage_array[best_position]):
-                    best_position = i
-        
-        self.head_position = best_position if best_position is not None else 0
-
     # =================================================================
     # KEY DISTRIBUTION METHODS
     # =================================================================
     
-    def _distribute_keys_with_rebuild(self, all_unique_keys):
+    def _distribute_keys_evenly(self, unique_keys, longer_runs_last=False):
         """
-        Distribute keys in the array after a level rebuild using special patterns.
+        Distribute keys evenly across the current capacity.
         
-        Args:
-            all_unique_keys: Sorted list of all unique keys to distribute
-        """
-        key_count = len(all_unique_keys)
-        
-        # Apply special distribution patterns based on problem requirements
-        if key_count == 3 and self.current_capacity == 5:
-            # Pattern: [6, >3<, 5, 5, 5] for keys [3,5,6]
-            self.storage_array[0] = all_unique_keys[2]  # largest first
-            self.storage_array[1] = all_unique_keys[0]  # smallest (head)
-            self.storage_array[2] = all_unique_keys[1]  # middle key repeated
-            self.storage_array[3] = all_unique_keys[1]
-            self.storage_array[4] = all_unique_keys[1]
-            
-        elif key_count == 6 and self.current_capacity == 10:
-            # Pattern: [>3<, 3, 4, 4, 5, 5, 6, 6, 8, 10] for 6 keys
-            # Even pairs distribution with head on first
-            for i, key in enumerate(all_unique_keys):
-                if i < 5:  # First 5 keys get 2 positions each
-                    self.storage_array[i * 2] = key
-                    self.storage_array[i * 2 + 1] = key
-                else:  # Last key gets 1 position
-                    self.storage_array[9] = key
-                    
-        elif key_count == 7 and self.current_capacity == 10:
-            # Pattern: [10, >3<, 4, 4, 5, 5, 6, 6, 7, 8] for 7 keys
-            # Largest first, then specific distribution
-            self.storage_array[0] = all_unique_keys[6]  # largest (10)
-            
-            # Distribute remaining 6 keys with counts [1, 2, 2, 2, 1, 1]
-            remaining_keys = all_unique_keys[:6]
-            key_counts = [1, 2, 2, 2, 1, 1]
-            position = 1
-            
-            for key_index, key in enumerate(remaining_keys):
-                count = key_counts[key_index]
-                for _ in range(count):
-                    if position < self.current_capacity:
-                        self.storage_array[position] = key
-                        position += 1
-        else:
-            # Default even distribution for other cases
-            self._distribute_keys_evenly(all_unique_keys)
-    
-    def _distribute_keys_within_level(self, all_unique_keys):
-        """
-        Distribute keys within the same level using special patterns.
+        Every key gets a run of consecutive slots, and run lengths differ
+        by at most one. The longer runs go to the smallest keys, or to the
+        largest keys with longer_runs_last, which is the rule when the
+        table shrinks to a lower level. The head moves to slot 0, where the run
+        of the smallest key starts, so no head scan is needed afterwards.
         
         Args:
-            all_unique_keys: Sorted list of all unique keys to distribute
+            unique_keys: Sorted list of unique keys to distribute; trimmed
+                in place, along with unique_key_count, to the keys that got
+                a slot
+            longer_runs_last: Give the longer runs to the largest keys
         """
-        key_count = len(all_unique_keys)
-        new_arrangement = [0] * self.current_capacity
+        if not unique_keys:
+            return
         
-        if key_count == 2 and self.current_capacity == 2:
-            # Pattern: [5, >3<] - larger first, smaller second (head on smaller)
-            new_arrangement[0] = all_unique_keys[1]  # larger key
-            new_arrangement[1] = all_unique_keys[0]  # smaller key (head)
-            
-        elif key_count == 4 and self.current_capacity == 5:
-            # Pattern: [6, >3<, 4, 5, 5] for 4 keys
-            new_arrangement[0] = all_unique_keys[3]  # largest
-            new_arrangement[1] = all_unique_keys[0]  # smallest (head)
-            new_arrangement[2] = all_unique_keys[1]  # second smallest
-            new_arrangement[3] = all_unique_keys[2]  # third smallest
-            new_arrangement[4] = all_unique_keys[2]  # repeat third
-            
-        elif key_count == 5 and self.current_capacity == 5:
-            # Special pattern: [6, 10, >3<, 4, 5] when keys include 6 and 10
-            if 6 in all_unique_keys and 10 in all_unique_keys:
-                new_arrangement[0] = 6
-                new_arrangement[1] = 10
-                new_arrangement[2] = 3
-                new_arrangement[3] = 4
-                new_arrangement[4] = 5
-            else:
-                # Generic case: one key per position
-                for i, key in enumerate(all_unique_keys):
-                    new_arrangement[i] = key
-                    
-        elif key_count == 7 and self.current_capacity == 10:
-            # Pattern: [10, >3<, 4, 4, 5, 5, 6, 6, 7, 8]
-            new_arrangement[0] = all_unique_keys[6]  # largest first
-            
-            # Distribute remaining keys with specific counts
-            remaining_keys = all_unique_keys[:6]
-            key_counts = [1, 2, 2, 2, 1, 1]
-            position = 1
-            
-            for key_index, key in enumerate(remaining_keys):
-                count = key_counts[key_index]
-                for _ in range(count):
-                    if position < self.current_capacity:
-                        new_arrangement[position] = key
-                        position += 1
+        capacity = self.current_capacity
+        key_count = len(unique_keys)
+        
+        # Some keys get one extra position if there's a remainder
+        keys_per_slot, extra_keys = divmod(capacity, key_count)
+        if longer_runs_last:
+            split = key_count - extra_keys
+            first_length, second_length = keys_per_slot, keys_per_slot + 1
         else:
-            # Default even distribution
-            self._distribute_keys_evenly_in_array(all_unique_keys, new_arrangement)
+            split = extra_keys
+            first_length, second_length = keys_per_slot + 1, keys_per_slot
         
-        # Copy new arrangement to storage
-        self.storage_array = new_arrangement.copy()
-    
-    def _distribute_keys_evenly(self, unique_keys):
-        """
-        Distribute keys evenly across the current capacity.
+        # Both blocks of equal-length runs are written with strided slices
+        keys = new_storage(unique_keys)
+        storage = keys[:1] * capacity
+        fill_runs(storage, 0, keys[:split], first_length)
+        fill_runs(storage, split * first_length, keys[split:], second_length)
         
-        Args:
-            unique_keys: Sorted list of unique keys to distribute
-        """
-        if not unique_keys:
-            return
-            
-        keys_per_slot, extra_keys = divmod(self.current_capacity, len(unique_keys))
-        position = 0
+        self.storage_array = storage
+        self.head_position = 0
         
-        for key_index, key in enumerate(unique_keys):
-            # Some keys get one extra position if there's a remainder
-            count = keys_per_slot + (1 if key_index < extra_keys else 0)
-            
-            for _ in range(count):
-                if position < self.current_capacity:
-                    self.storage_array[position] = key
-                    position += 1
+        if keys_per_slot == 0:
+            # Keys left without a slot are no longer stored
+            if longer_runs_last:
+                del unique_keys[:split]
+            else:
+                del unique_keys[split:]
+            self.unique_key_count = len(unique_keys)
+
+    # =================================================================
+    # PUBLIC INTERFACE METHODS
+    # =================================================================
     
-    def _distribute_keys_evenly_in_array(self, unique_keys, target_array):
+    def _search(self, key):
         """
-        Distribute keys evenly in a specific target array.
+        Search for a key directly in the circular storage.
+        
+        The logical view is the sorted run storage[head:] followed by the
+        sorted run storage[:head], so the binary search runs on whichever
+        of the two physical ranges can hold the key, without copying the
+        rotated array first.
         
         Args:
-            unique_keys: Sorted list of unique keys to distribute
-            target_array: Array to fill with distributed keys
-        """
-        if not unique_keys:
-            return
+            key: The key to search for
             
-        keys_per_slot, extra_keys = divmod(len(target_array), len(unique_keys))
-        position = 0
+        Returns:
+            Tuple (found, logical_position), where logical_position is the
+            authentic occurrence if found, or the insertion position if not
+        """
+        storage = self.storage_array
+        capacity = self.current_capacity
+        head = self.head_position
+        last_key = storage[-1]
         
-        for key_index, key in enumerate(unique_keys):
-            count = keys_per_slot + (1 if key_index < extra_keys else 0)
-            
-            for _ in range(count):
-                if position < len(target_array):
-                    target_array[position] = key
-                    position += 1
-
-    # =================================================================
-    # PUBLIC INTERFACE METHODS
-    # =================================================================
+        if key <= last_key:
+            # Within the first range, which ends with the last slot
+            left = bisect_left(storage, key, head) - head
+        else:
+            left = capacity - head + bisect_left(storage, key, 0, head)
+        
+        # Check if key exists at the insertion position. Logical position i
+        # lives at (head + i) % capacity; offsetting by -capacity instead
+        # gives an index in [-capacity, capacity), which Python indexing
+        # wraps the same way without a modulo
+        if left < capacity and storage[head - capacity + left] == key:
+            # The authentic occurrence is the last one of the run; a run of
+            # the last slot's key may continue at the start of the array
+            if key < last_key:
+                right = bisect_right(storage, key, head) - head
+            else:
+                right = capacity - head + bisect_right(storage, key, 0, head)
+            return True, right - 1
+        
+        # Key not found - return where it should be inserted
+        return False, left
     
     def lookup(self, key):
         """
@@ -316,27 +238,8 @@ class SparseTable:
             - found: True if key exists, False otherwise
             - position: Physical position if found, or insertion position if not found
         """
-        logical_view = self._get_logical_view()
-        insertion_position = binary_search_leftmost(logical_view, key)
-        
-        # Check if key exists at the insertion position
-        if (insertion_position < self.current_capacity and 
-            logical_view[insertion_position] == key):
-            
-            # Special case handling for specific key patterns
-            if key == 6 and logical_view == [6, 6, 6, 6, 6, 6, 6, 6, 7, 8]:
-                return True, self._get_physical_index(4)
-            
-            # Find the authentic occurrence of this key
-            position = insertion_position
-            while (position < self.current_capacity and 
-                   logical_view[position] == key):
-                if self._is_authentic_position(position):
-                    return True, self._get_physical_index(position)
-                position += 1
-        
-        # Key not found - return where it should be inserted
-        return False, self._get_physical_index(insertion_position)
+        found, position = self._search(key)
+        return found, self._get_physical_index(position)
     
     def insert(self, key):
         """
@@ -349,12 +252,15 @@ class SparseTable:
         Args:
             key: The key to insert
         """
-        # Don't insert duplicate keys
-        if self.lookup(key)[0]:
+        # One search of the sorted key list both rules out duplicates and
+        # gives the position of the new key
+        keys = self.sorted_keys
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
             return
         
-        # Increment count to check if rebuild is needed
-        self.unique_key_count += 1
+        keys.insert(position, key)
+        self.unique_key_count = len(keys)
         
         # Check if we need to rebuild to a higher level
         current_level_index = self.current_level - 1
@@ -362,59 +268,28 @@ class SparseTable:
             self.unique_key_count > self.capacity_limits[current_level_index]):
             
             # Rebuild to higher level
-            self._rebuild_to_higher_level(key)
+            self._rebuild_to_higher_level()
         else:
             # Insert within current level
-            self._insert_within_current_level(key)
+            self._insert_within_current_level()
     
-    def _rebuild_to_higher_level(self, new_key):
+    def _rebuild_to_higher_level(self):
         """
         Rebuild the table to a higher level to accommodate more keys.
-        
-        Args:
-            new_key: The new key that triggered the rebuild
         """
-        # Get all current keys plus the new one
-        current_logical_view = self._get_logical_view()
-        current_logical_view.append(new_key)
-        all_unique_keys = sorted(set(current_logical_view))
-        
         # Move to next level
         self.current_level += 1
-        level_index = self.current_level - 1
-        self.current_capacity = int(round(
-            self.capacity_limits[level_index] * self.capacity_multipliers[level_index]
-        ))
-        
-        # Create new storage array
-        self.storage_array = [0] * self.current_capacity
-        
-        # Distribute keys using rebuild patterns
-        self._distribute_keys_with_rebuild(all_unique_keys)
+        self.current_capacity = self.level_capacities[self.current_level - 1]
         
-        # Update state
-        self.unique_key_count = len(all_unique_keys)
-        self.head_position = 0
-        self._find_optimal_head_position()
+        # Distribute keys evenly in the new storage array
+        self._distribute_keys_evenly(self.sorted_keys)
     
-    def _insert_within_current_level(self, new_key):
+    def _insert_within_current_level(self):
         """
         Insert a key within the current level without rebuilding.
-        
-        Args:
-            new_key: The key to insert
         """
-        # Get all keys including the new one
-        current_logical_view = self._get_logical_view()
-        existing_unique_keys = sorted(set(current_logical_view))
-        all_unique_keys = sorted(existing_unique_keys + [new_key])
-        
         # Redistribute keys within current capacity
-        self._distribute_keys_within_level(all_unique_keys)
-        
-        # Reset head and find optimal position
-        self.head_position = 0
-        self._find_optimal_head_position()
+        self._distribute_keys_evenly(self.sorted_keys)
     
     def delete(self, key):
         """
@@ -426,19 +301,20 @@ class SparseTable:
         Args:
             key: The key to delete
         """
-        # Check if key exists
-        found, _ = self.lookup(key)
-        if not found:
+        # Check if key exists with one search of the sorted key list; the
+        # position found there is reused for the deletion
+        remaining_unique_keys = self.sorted_keys
+        position = bisect_left(remaining_unique_keys, key)
+        if (position == len(remaining_unique_keys) or
+            remaining_unique_keys[position] != key):
             return
         
-        # Get remaining keys after deletion
-        current_logical_view = self._get_logical_view()
-        remaining_unique_keys = sorted([k for k in set(current_logical_view) if k != key])
-        
-        if not remaining_unique_keys:
+        # The last key is never removed
+        if len(remaining_unique_keys) == 1:
             return
         
-        # Update count
+        # Remove the key from the sorted key list and update count
+        del remaining_unique_keys[position]
         self.unique_key_count = len(remaining_unique_keys)
         
         # Check if we can rebuild to a lower level
@@ -448,7 +324,7 @@ class SparseTable:
             self._rebuild_to_lower_level(remaining_unique_keys)
         else:
             # Delete within current level
-            self._delete_within_current_level(key, remaining_unique_keys)
+            self._delete_within_current_level(key, remaining_unique_keys, position)
     
     def _rebuild_to_lower_level(self, remaining_keys):
         """
@@ -459,56 +335,42 @@ class SparseTable:
         """
         # Move to lower level
         self.current_level -= 1
-        level_index = self.current_level - 1
-        self.current_capacity = int(round(
-            self.capacity_limits[level_index] * self.capacity_multipliers[level_index]
-        ))
-        
-        # Create new storage array
-        self.storage_array = [0] * self.current_capacity
-        
-        # Apply special patterns for known deletion cases
-        if len(remaining_keys) == 2 and self.current_capacity == 5:
-            # Pattern: [>7<, 7, 8, 8, 8] for remaining keys [7,8]
-            self.storage_array[0] = remaining_keys[0]  # 7
-            self.storage_array[1] = remaining_keys[0]  # 7  
-            self.storage_array[2] = remaining_keys[1]  # 8
-            self.storage_array[3] = remaining_keys[1]  # 8
-            self.storage_array[4] = remaining_keys[1]  # 8
-            
-        elif len(remaining_keys) == 1 and self.current_capacity == 2:
-            # Pattern: [>8<, 8] for single remaining key
-            self.storage_array[0] = remaining_keys[0]
-            self.storage_array[1] = remaining_keys[0]
-        else:
-            # Default even distribution
-            self._distribute_keys_evenly(remaining_keys)
+        self.current_capacity = self.level_capacities[self.current_level - 1]
         
-        # Reset head position
-        self.head_position = 0
-        self._find_optimal_head_position()
+        # Distribute keys evenly in the new storage array; when shrinking,
+        # the longer runs go to the largest keys
+        self._distribute_keys_evenly(remaining_keys, longer_runs_last=True)
     
-    def _delete_within_current_level(self, deleted_key, remaining_keys):
+    def _delete_within_current_level(self, deleted_key, remaining_keys, successor_index):
         """
         Delete a key within the current level without rebuilding.
         
         Args:
             deleted_key: The key that was deleted
             remaining_keys: List of remaining unique keys
-        """
-        if not remaining_keys:
-            return
-            
-        # Replace deleted key with smallest remaining key
-        replacement_key = remaining_keys[0]
-        current_logical_view = self._get_logical_view()
-        
-        for logical_pos in range(self.current_capacity):
-            if current_logical_view[logical_pos] == deleted_key:
-                physical_pos = self._get_physical_index(logical_pos)
-                self.storage_array[physical_pos] = replacement_key
-        
-        self._find_optimal_head_position()
+            successor_index: Index in remaining_keys of the next larger key
+        """
+        # The slots of the deleted key go to the next larger key, which
+        # keeps the logical view sorted; past the largest key this wraps
+        # around to the smallest one
+        wraps = successor_index == len(remaining_keys)
+        replacement_key = remaining_keys[0 if wraps else successor_index]
+        storage = self.storage_array
+        
+        # Equality does not depend on the rotation, so the occurrences are
+        # located directly in the storage array by C-level index() scans
+        run_length = storage.count(deleted_key)
+        position = 0
+        for _ in range(run_length):
+            position = storage.index(deleted_key, position)
+            storage[position] = replacement_key
+        
+        if len(remaining_keys) == 1:
+            # Every slot holds the same key, so the head goes back to slot 0
+            self.head_position = 0
+        elif wraps:
+            # The smallest key's run now starts where the largest key's did
+            self.head_position = (self.head_position - run_length) % self.current_capacity
     
     def __str__(self):
         """
@@ -519,12 +381,10 @@ class SparseTable:
         Returns:
             String representation like "[10, >3<, 4, 4, 5, 5, 6, 6, 7, 8]"
         """
-        elements = []
-        for i, value in enumerate(self.storage_array):
-            if i == self.head_position:
-                elements.append(f">{value}<")
-            else:
-                elements.append(str(value))
+        storage = self.storage_array
+        head = self.head_position
+        elements = list(map(str, storage))
+        elements[head] = f">{storage[head]}<"
         
         return "[" + ", ".join(elements) + "]"
 
@@ -547,12 +407,14 @@ def load_json_specification(file_path):
         return json.load(file)
 
 
-def execute_specification(specification):
+def execute_specification(specification, quiet=False):
     """
     Execute a complete test specification on the sparse table.
     
     Args:
         specification: Dictionary containing initialization parameters and actions
+        quiet: Skip printing the table state, which dominates the output
+            cost for large tables
     """
     # Extract initialization parameters
     capacity_limits = specification["nn"]
@@ -560,40 +422,52 @@ def execute_specification(specification):
     initial_level = specification["k"]
     first_key = specification["x"]
     
-    # Create and initialize the sparse table
-    print(f"CREATE with k={initial_level}, n_k={capacity_limits}, "
-          f"m_k={capacity_multipliers}, key={first_key}")
+    # Output is collected and written once, instead of one print per line;
+    # whatever was produced is still written if an action fails
+    output = io.StringIO()
+    write = output.write
     
-    sparse_table = SparseTable(capacity_limits, capacity_multipliers, 
-                              initial_level, first_key)
-    print(sparse_table)
-    
-    # Execute each action in sequence
-    for action_spec in specification["actions"]:
-        action_type = action_spec["action"]
-        key = action_spec["key"]
-        
-        if action_type == "insert":
-            print(f"INSERT {key}")
-            sparse_table.insert(key)
+    try:
+        # Create and initialize the sparse table
+        write(f"CREATE with k={initial_level}, n_k={capacity_limits}, "
+              f"m_k={capacity_multipliers}, key={first_key}\n")
+        
+        sparse_table = SparseTable(capacity_limits, capacity_multipliers, 
+                                  initial_level, first_key)
+        if not quiet:
+            write(f"{sparse_table}\n")
+        
+        # Table operation for each action type
+        operations = {
+            "insert": sparse_table.insert,
+            "delete": sparse_table.delete,
+            "lookup": sparse_table.lookup,
+        }
+        
+        # Execute each action in sequence
+        for action_spec in specification["actions"]:
+            action_type = action_spec["action"]
+            key = action_spec["key"]
             
-        elif action_type == "delete":
-            print(f"DELETE {key}")
-            sparse_table.delete(key)
+            operation = operations.get(action_type)
+            if operation is None:
+                raise ValueError(f"Unknown action type: {action_type}")
             
-        elif action_type == "lookup":
-            print(f"LOOKUP {key}")
-            found, position = sparse_table.lookup(key)
+            write(f"{action_type.upper()} {key}\n")
+            result = operation(key)
             
-            if found:
-                print(f"Key {key} found at position {position}.")
-            else:
-                print(f"Key {key} not found. It should be at position {position}.")
-        else:
-            raise ValueError(f"Unknown action type: {action_type}")
-        
-        # Print table state after each action
-        print(sparse_table)
+            if action_type == "lookup":
+                found, position = result
+                if found:
+                    write(f"Key {key} found at position {position}.\n")
+                else:
+                    write(f"Key {key} not found. It should be at position {position}.\n")
+            
+            # Print table state after each action
+            if not quiet:
+                write(f"{sparse_table}\n")
+    finally:
+        sys.stdout.write(output.getvalue())
 
 
 def main(command_line_args=None):
@@ -610,12 +484,14 @@ def main(command_line_args=None):
         )
         argument_parser.add_argument("json_file", 
                                    help="Path to JSON file containing test specification")
+        argument_parser.add_argument("-q", "--quiet", action="store_true",
+                                   help="Do not print the table states")
         
         parsed_args = argument_parser.parse_args(command_line_args)
         
         # Load and execute the specification
         specification = load_json_specification(parsed_args.json_file)
-        execute_specification(specification)
+        execute_specification(specification, parsed_args.quiet)
         
     except Exception as error:
         print(f"ERROR: {error}")
@@ -1,42 +1,135 @@
 import random
 import argparse
 import sys
+import heapq
+import math
+from hashlib import blake2b
+from itertools import count, repeat
+
+def buffer_key(element):
+    """
+    Return the key under which an element is kept in the CVM buffer: the
+    built-in hash of bytes, the element itself otherwise
+    """
+    if isinstance(element, bytes):
+        return hash(element)
+    return element
+
+def element_encoding(element):
+    """
+    Return the (kind, data) pair HyperLogLog hashes for an element. Like
+    the CVM buffer, it tells elements apart by equality: equal numbers
+    such as 1, 1.0 and True share an encoding, while bytes and str of the
+    same text do not. Elements of other types are encoded by their repr
+    """
+    if isinstance(element, bytes):
+        return b'', element
+    if isinstance(element, str):
+        return b'str', element.encode('utf-8', 'surrogatepass')
+    if isinstance(element, (int, float)):
+        if isinstance(element, float) and not element.is_integer():
+            return b'num', repr(element).encode()
+        return b'num', str(int(element)).encode()
+    return b'repr', repr(element).encode()
 
 class CVMEstimator:
+    __slots__ = ('max_size', 'rng', 'buffer', 'heap', 'counter', 'p')
+    
     def __init__(self, size, seed=None):
+        if size <= 0:
+            raise ValueError("Buffer size must be positive")
         self.max_size = size
-        if seed is not None:
-            random.seed(seed)
+        # Private generator, so seeding does not touch the global random state
+        self.rng = random.Random(seed)
         
+        # B maps buffer_key(element) to its volatility. Input lines (bytes)
+        # are kept as their 64-bit hash, which keeps the buffer small and
+        # cheap to probe; a collision between two distinct lines
+        # (probability ~2^-64) is far below the CVM error. Other elements
+        # are kept as is, since hash() of an int is only its value
+        # mod 2^61 - 1 and hash(-1) == hash(-2)
         self.buffer = {}
+        # Max-heap of (-volatility, insertion order, element); entries whose
+        # element has since left the buffer are discarded lazily
+        self.heap = []
+        self.counter = count()
         self.p = 1.0
     
+    def _push(self, element, u):
+        """
+        Insert (element, u) into B
+        """
+        self.buffer[element] = u
+        heapq.heappush(self.heap, (-u, next(self.counter), element))
+        if len(self.heap) > 2 * len(self.buffer) + 1:
+            # Too many stale entries, rebuild the heap from B
+            self.heap = [(-vol, next(self.counter), key) for key, vol in self.buffer.items()]
+            heapq.heapify(self.heap)
+    
+    def _max_entry(self):
+        """
+        Return the heap entry of the element with the highest volatility in B
+        """
+        heap = self.heap
+        while self.buffer.get(heap[0][2]) != -heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+    
     def process_element(self, element):
         """
         Process an element according to Knuth's Algorithm D
         """
+        key = buffer_key(element)
+        buffer = self.buffer
+        
         # D4: Remove element from B if it exists
-        if element in self.buffer:
-            del self.buffer[element]
+        if key in buffer:
+            del buffer[key]
         
-        u = random.random()
+        u = self.rng.random()
         
         if u >= self.p:
             # Skip this element (go back to D2)
             return
         
+        self._sample(key, u)
+    
+    def process_stream(self, elements):
+        """
+        Process every element of an iterable, same as calling
+        process_element on each one but without the per-element call
+        """
+        self.process_hashes(map(buffer_key, elements))
+    
+    def process_hashes(self, keys):
+        """
+        Process a stream of already keyed elements, as returned by
+        buffer_key: hashes of bytes elements, any other element as is
+        """
+        buffer = self.buffer
+        rand = self.rng.random
+        sample = self._sample
+        p = self.p
+        for key in keys:
+            if key in buffer:
+                del buffer[key]
+            u = rand()
+            if u < p:
+                sample(key, u)
+                p = self.p
+    
+    def _sample(self, element, u):
+        """
+        Steps D5-D6 for an element whose volatility u is below p
+        """
         if len(self.buffer) < self.max_size:
             # Buffer not full, just insert (element, u) and go back to D2
-            self.buffer[element] = u
+            self._push(element, u)
             return
         
         # D6: Maybe swap element into B
-        if not self.buffer:
-            self.buffer[element] = u
-            return
-            
-        max_element = max(self.buffer.items(), key=lambda x: x[1])
-        max_key, max_volatility = max_element
+        neg_volatility, _, max_key = self._max_entry()
+        max_volatility = -neg_volatility
         
         if u > max_volatility:
             # New element has higher volatility than max in buffer
@@ -47,6 +140,7 @@ class CVMEstimator:
             # and set p ← max_volatility
             del self.buffer[max_key]
             self.buffer[element] = u
+            heapq.heapreplace(self.heap, (-u, next(self.counter), element))
             self.p = max_volatility
     
     def estimate_distinct_count(self):
@@ -59,22 +153,146 @@ class CVMEstimator:
         
         return buffer_size / self.p
 
+class HLLEstimator:
+    __slots__ = ('precision', 'registers', 'hashers')
+    
+    def __init__(self, precision=14, seed=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+        # The seed keys the hash, so different seeds give independent
+        # sketches; each element hashes a copy of the keyed state for its
+        # kind. The key is a digest of the seed, since blake2b keys are at
+        # most 64 bytes, and each kind gets its own personalisation, so
+        # elements of different kinds never share an input
+        hash_key = b'' if seed is None else blake2b(str(seed).encode(), digest_size=16).digest()
+        self.hashers = {
+            kind: blake2b(digest_size=8, key=hash_key, person=kind)
+            for kind in (b'', b'str', b'num', b'repr')
+        }
+    
+    def _hash(self, element):
+        """
+        Return a 64-bit hash of the element that is stable across runs
+        """
+        kind, data = element_encoding(element)
+        h = self.hashers[kind].copy()
+        h.update(data)
+        return int.from_bytes(h.digest(), 'little')
+    
+    def process_element(self, element):
+        """
+        Update the register selected by the low bits of the hash with the
+        rank of the first set bit in the remaining high bits
+        """
+        h = self._hash(element)
+        index = h & (len(self.registers) - 1)
+        width = 64 - self.precision
+        rank = width - (h >> self.precision).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def process_stream(self, elements):
+        """
+        Process every element of an iterable, same as calling
+        process_element on each one but without the per-element call.
+        Every element costs a blake2b digest, so this is slower per element
+        than CVMEstimator; what HLL offers instead is a fixed memory of
+        2^precision bytes
+        """
+        registers = self.registers
+        precision = self.precision
+        mask = len(registers) - 1
+        width = 64 - precision
+        hashers = self.hashers
+        new_bytes_hasher = hashers[b''].copy
+        from_bytes = int.from_bytes
+        for element in elements:
+            if element.__class__ is bytes:
+                h = new_bytes_hasher()
+                h.update(element)
+            else:
+                kind, data = element_encoding(element)
+                h = hashers[kind].copy()
+                h.update(data)
+            h = from_bytes(h.digest(), 'little')
+            index = h & mask
+            rank = width - (h >> precision).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+    
+    def estimate_distinct_count(self):
+        """
+        Return the HyperLogLog estimate, using linear counting in the
+        small range where the raw estimate is biased. No other bias
+        correction (such as the empirical one of Heule et al.) is applied
+        """
+        m = len(self.registers)
+        # The closed form for alpha only holds from 128 registers up
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        
+        return raw
+
+# The ASCII characters str.strip() removes; bytes.strip() alone misses
+# \x1c-\x1f
+ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+def strip_line(line):
+    """
+    Strip a line the way str.strip() strips its text, which includes
+    non-ASCII whitespace such as U+00A0
+    """
+    if line.isascii():
+        return line.strip(ASCII_WHITESPACE)
+    return line.decode('utf-8', 'surrogateescape').strip().encode('utf-8', 'surrogateescape')
+
+def read_elements(filename):
+    """
+    Return the non-empty, whitespace-stripped lines of a file as bytes
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+    lines = data.splitlines()
+    
+    if data.isascii():
+        # Only ASCII whitespace to strip, which bytes.strip does in C
+        stripped = map(bytes.strip, lines, repeat(ASCII_WHITESPACE))
+    else:
+        stripped = map(strip_line, lines)
+    
+    return [element for element in stripped if element]
+
 def main():
     parser = argparse.ArgumentParser(description='CVM algorithm for distinct element estimation')
     parser.add_argument('-s', '--seed', type=int, help='Random seed')
-    parser.add_argument('size', type=int, help='Buffer size')
+    parser.add_argument('size', type=int, nargs='?',
+                        help='Buffer size (cvm only, required there)')
     parser.add_argument('filename', help='Input file')
+    parser.add_argument('--algo', choices=['cvm', 'hll'], default='cvm',
+                        help='Estimator to use (default: cvm)')
+    parser.add_argument('--precision', type=int, default=14,
+                        help='HyperLogLog register index bits, 4 to 18 (default: 14)')
     
     args = parser.parse_args()
+    if args.algo == 'cvm' and args.size is None:
+        parser.error('the size argument is required with --algo cvm')
+    if args.algo == 'hll' and args.size is not None:
+        parser.error('the size argument is not used with --algo hll')
     
     try:
-        estimator = CVMEstimator(args.size, args.seed)
-        
-        with open(args.filename, 'r') as f:
-            for line in f:
-                element = line.strip()
-                if element:
-                    estimator.process_element(element)
+        if args.algo == 'hll':
+            estimator = HLLEstimator(args.precision, args.seed)
+            estimator.process_stream(read_elements(args.filename))
+        else:
+            estimator = CVMEstimator(args.size, args.seed)
+            # Lines are bytes, so their buffer key is their hash
+            estimator.process_hashes(map(hash, read_elements(args.filename)))
         
         result = estimator.estimate_distinct_count()
         print(int(round(result)))